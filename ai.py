@@ -0,0 +1,92 @@
+import functools
+from typing import NamedTuple, Tuple
+
+# ---------- Look-ahead enemy AI (minimax with alpha-beta pruning) ----------
+#
+# Attacks are scored by their expected damage instead of being rolled, so a search is deterministic
+# and _search can be memoised: its lru_cache acts as the transposition table. Only the two active
+# Pokémon are modelled; switches and potions are not searched.
+
+MoveValue = Tuple[int, int]  # (expected damage, expected burn damage if the target isn't burned yet)
+
+WIN = 2.0   # a won position outscores any HP difference, which lies in [-1, 1]
+INF = float("inf")
+
+
+class AIState(NamedTuple):
+    """One matchup as plain numbers, from the enemy's point of view."""
+    enemy_hp: int
+    enemy_max_hp: int
+    enemy_burn: int
+    enemy_moves: Tuple[MoveValue, ...]
+    player_hp: int
+    player_max_hp: int
+    player_burn: int
+    player_moves: Tuple[MoveValue, ...]
+    burn_damage: int  # HP a burned Pokémon loses at the start of its turn
+
+
+def _play(s: AIState, enemy_moving: bool, move: MoveValue, tick: bool = True) -> AIState:
+    """The state after one turn: the mover's burn ticks (unless `tick` is False), then it attacks with
+    `move` if still standing."""
+    if enemy_moving:
+        hp, burn, foe_hp, foe_burn = s.enemy_hp, s.enemy_burn, s.player_hp, s.player_burn
+    else:
+        hp, burn, foe_hp, foe_burn = s.player_hp, s.player_burn, s.enemy_hp, s.enemy_burn
+    if tick and burn > 0:
+        burn -= 1
+        hp = hp - s.burn_damage if hp > s.burn_damage else 0
+    if hp > 0:
+        # a possible burn is counted up front, as its expected damage
+        dmg = move[0] + (move[1] if foe_burn == 0 else 0)
+        foe_hp = foe_hp - dmg if foe_hp > dmg else 0
+    if enemy_moving:
+        return s._replace(enemy_hp=hp, enemy_burn=burn, player_hp=foe_hp)
+    return s._replace(player_hp=hp, player_burn=burn, enemy_hp=foe_hp)
+
+
+def _score(s: AIState) -> float:
+    if s.player_hp <= 0:
+        return 0.0 if s.enemy_hp <= 0 else WIN
+    if s.enemy_hp <= 0:
+        return -WIN
+    return s.enemy_hp / s.enemy_max_hp - s.player_hp / s.player_max_hp
+
+
+@functools.lru_cache(maxsize=100_000)
+def _search(s: AIState, depth: int, alpha: float, beta: float, enemy_moving: bool) -> float:
+    """Minimax value of `s` for the enemy, looking `depth` turns ahead."""
+    if s.enemy_hp <= 0 or s.player_hp <= 0:
+        # scale by the turns left, so a sooner win (or a later loss) scores better
+        return _score(s) * (1 + depth)
+    if depth == 0:
+        return _score(s)
+    if enemy_moving:
+        best = -INF
+        for move in s.enemy_moves:
+            best = max(best, _search(_play(s, True, move), depth - 1, alpha, beta, False))
+            alpha = max(alpha, best)
+            if alpha >= beta:
+                break
+        return best
+    best = INF
+    for move in s.player_moves:
+        best = min(best, _search(_play(s, False, move), depth - 1, alpha, beta, True))
+        beta = min(beta, best)
+        if alpha >= beta:
+            break
+    return best
+
+
+def best_move(state: AIState, depth: int = 4) -> int:
+    """Index into state.enemy_moves of the enemy's best move, searching `depth` turns (plies) ahead.
+
+    `state` is taken at the point the enemy picks its move, after its start-of-turn burn has already
+    ticked, so the first ply doesn't tick it again.
+    """
+    best_idx, alpha = 0, -INF
+    for i, move in enumerate(state.enemy_moves):
+        score = _search(_play(state, True, move, tick=False), depth - 1, alpha, INF, False)
+        if score > alpha:
+            best_idx, alpha = i, score
+    return best_idx
@@ -1,37 +1,101 @@
 # I acknowledge the use of Microsoft Copilot (M365 Copilot, Microsoft, https://copilot.microsoft.com/) to co-create code in this file.
 
+import array
+import collections
+import functools
 import json
 import os
 import random
 import tkinter as tk
-from dataclasses import dataclass
-from typing import List, Tuple, Optional
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Callable, Dict, List, NamedTuple, Tuple, Optional
+
+import ai
+
+try:  # optional faster JSON codec; the stdlib fallbacks work the same on bytes
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
 
 # ---------- Data (no dependencies) ----------
 
-@dataclass
+class PType(IntEnum):
+    """Small-int ids for the full 18-type chart; the type strings are kept for display."""
+    FIRE = 0
+    WATER = 1
+    GRASS = 2
+    NORMAL = 3
+    ELECTRIC = 4
+    ICE = 5
+    FIGHTING = 6
+    POISON = 7
+    GROUND = 8
+    FLYING = 9
+    PSYCHIC = 10
+    BUG = 11
+    ROCK = 12
+    GHOST = 13
+    DRAGON = 14
+    DARK = 15
+    STEEL = 16
+    FAIRY = 17
+
+
+def type_id(name: str) -> int:
+    """Id for a type name. Types without a PType entry are neutral, so they share NORMAL's id."""
+    member = PType.__members__.get(name.upper())
+    return int(member if member is not None else PType.NORMAL)
+
+
+@dataclass(frozen=True, slots=True)
 class Move:
     name: str
     mtype: str
     power: int
     accuracy: int = 100  # default to always hit unless specified
+    mtype_id: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "mtype_id", type_id(self.mtype))
 
 
-@dataclass
+@dataclass(slots=True)
 class Pokemon:
     name: str
     ptype: str
     max_hp: int
     hp: int
-    moves: List[Move]
+    moves: Tuple[Move, ...]  # shared, never mutated: clones reuse the template's tuple
     burn: int = 0  # remaining turns of burn (0 = none)
+    ptype_id: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.ptype_id = type_id(self.ptype)
+
+
+class DamageResult(NamedTuple):
+    missed: bool
+    damage: int
+    crit: bool
+    mult: float
+    burned: bool
+
+
+# Shared result for every missed attack
+_MISS = DamageResult(True, 0, False, 1.0, False)
 
 
 # Small static roster (consistent across versions)
 ROSTER = [
-    Pokemon("Charmander", "Fire", 60, 60, [Move("Scratch", "Normal", 10), Move("Ember", "Fire", 14, 95), Move("Growl", "Normal", 6)]),
-    Pokemon("Squirtle",   "Water", 62, 62, [Move("Tackle",  "Normal", 10), Move("Water Gun", "Water", 14, 95), Move("Tail Whip", "Normal", 6)]),
-    Pokemon("Bulbasaur",  "Grass", 58, 58, [Move("Pound",   "Normal", 10), Move("Vine Whip", "Grass", 14, 95), Move("Growl", "Normal", 6)]),
+    Pokemon("Charmander", "Fire", 60, 60, (Move("Scratch", "Normal", 10), Move("Ember", "Fire", 14, 95), Move("Growl", "Normal", 6))),
+    Pokemon("Squirtle",   "Water", 62, 62, (Move("Tackle",  "Normal", 10), Move("Water Gun", "Water", 14, 95), Move("Tail Whip", "Normal", 6))),
+    Pokemon("Bulbasaur",  "Grass", 58, 58, (Move("Pound",   "Normal", 10), Move("Vine Whip", "Grass", 14, 95), Move("Growl", "Normal", 6))),
 ]
 
 
@@ -42,62 +106,148 @@ EFFECT = {
 }
 
 
-def type_multiplier(att_type: str, def_type: str) -> float:
-    return EFFECT.get((att_type, def_type), 1.0)
+_N_TYPES = len(PType)
+# EFFECT as a flat table indexed by att_id * _N_TYPES + def_id (18 * 18 = 324 entries);
+# adding a pairing to EFFECT is all it takes to extend the chart
+_EFF = array.array("f", (EFFECT.get((a.name.capitalize(), d.name.capitalize()), 1.0) for a in PType for d in PType))
+
+
+def type_multiplier(att_id: int, def_id: int) -> float:
+    """Effectiveness of an attack of type att_id on a defender of type def_id (PType ids, see Move.mtype_id / Pokemon.ptype_id)."""
+    return _EFF[att_id * _N_TYPES + def_id]
+
+
+# ---------- Random rolls ----------
+# One shared generator
+_rng = random.Random()
+
+
+def _pick_k(seq: list, k: int, rng: random.Random = _rng) -> list:
+    """Pick k distinct items from seq: partial Fisher–Yates, O(k), only the touched indices are stored."""
+    n = len(seq)
+    if not 0 <= k <= n:
+        raise ValueError("sample larger than population")
+    swapped: dict = {}
+    picks = []
+    for i in range(k):
+        j = rng.randrange(i, n)
+        picks.append(seq[swapped.get(j, j)])
+        swapped[j] = swapped.get(i, i)
+    return picks
 
 
 # ---------- Mechanics ----------
-def clamp(n: int, lo: int, hi: int) -> int:
-    return max(lo, min(hi, n))
+BURN_DAMAGE = 2    # HP lost per burned turn
+BURN_TURNS = 3     # turns a burn lasts
+BURN_CHANCE = 0.20  # chance a damaging Fire move burns
+CRIT_CHANCE = 0.10  # chance an attack lands a 1.5x critical hit
+_FIRE = int(PType.FIRE)  # plain int, so the hot path skips the PType attribute lookup
 
 
 def clone_pokemon(template: Pokemon) -> Pokemon:
-    return Pokemon(template.name, template.ptype, template.max_hp, template.max_hp, list(template.moves), 0)
+    # moves are read-only in battle, so every clone shares the template's tuple
+    return Pokemon(template.name, template.ptype, template.max_hp, template.max_hp, template.moves, 0)
+
+
+def reset_pokemon(p: Pokemon) -> None:
+    """Restore a battle copy to full health in place, so it can be reused instead of re-cloned."""
+    p.hp = p.max_hp
+    p.burn = 0
 
 
 def apply_burn(p: Pokemon) -> int:
     """Apply burn damage at start of turn. Returns damage dealt."""
-    if p.burn > 0 and p.hp > 0:
-        p.burn -= 1
-        dmg = 2
-        p.hp = clamp(p.hp - dmg, 0, p.max_hp)
-        return dmg
+    burn, hp = p.burn, p.hp
+    if burn > 0 and hp > 0:
+        p.burn = burn - 1
+        p.hp = hp - BURN_DAMAGE if hp > BURN_DAMAGE else 0
+        return BURN_DAMAGE
     return 0
 
 
-def deal_damage(attacker: Pokemon, defender: Pokemon, move: Move) -> dict:
-    if random.randint(1, 100) > move.accuracy:
-        return {"missed": True, "damage": 0, "crit": False, "mult": 1.0, "burned": False}
+def roll_damage(power: int, accuracy: int, mult: float, rng: random.Random = _rng) -> Tuple[bool, int, bool]:
+    """Roll one attack from plain numbers. Returns (missed, damage, crit); shared by the GUI and sim paths."""
+    # Status-style moves can't do damage, so no roll can change the outcome
+    if power <= 0:
+        return False, 0, False
+    # same odds as randint(1, 100) > accuracy, without randint's rejection sampling;
+    # sure-hit moves skip the roll entirely
+    rand = rng.random
+    if accuracy < 100 and rand() >= accuracy * 0.01:
+        return True, 0, False
 
-    base = move.power + random.randint(-2, 2)
-    mult = type_multiplier(move.mtype, defender.ptype)
-    crit = random.random() < 0.10
+    base = power + int(rand() * 5) - 2  # uniform jitter in [-2, 2]
+    crit = rand() < CRIT_CHANCE
     if crit:
         base = int(base * 1.5)
 
-    dmg = max(1, int(base * mult)) if move.power > 0 else 0
-    defender.hp = clamp(defender.hp - dmg, 0, defender.max_hp)
+    return False, max(1, int(base * mult)), crit
+
+
+def deal_damage(attacker: Pokemon, defender: Pokemon, move: Move, rng: random.Random = _rng) -> DamageResult:
+    # each field is read once into a local; the code below only touches locals
+    mtype_id = move.mtype_id
+    mult = _EFF[mtype_id * _N_TYPES + defender.ptype_id]
+    missed, dmg, crit = roll_damage(move.power, move.accuracy, mult, rng)
+    if missed:
+        return _MISS
+
+    # dmg is never negative, so only the lower bound can be crossed
+    hp = defender.hp
+    hp = hp - dmg if hp > dmg else 0
+    defender.hp = hp
 
     # Fire moves have 20% chance to burn
     burned = False
-    if move.mtype == "Fire" and dmg > 0 and defender.hp > 0 and defender.burn == 0 and random.random() < 0.20:
-        defender.burn = 3
+    if mtype_id == _FIRE and dmg > 0 and hp > 0 and defender.burn == 0 and rng.random() < BURN_CHANCE:
+        defender.burn = BURN_TURNS
         burned = True
 
-    return {"missed": False, "damage": dmg, "crit": crit, "mult": mult, "burned": burned}
+    return DamageResult(False, dmg, crit, mult, burned)
+
+
+def expected_damage(move: Move, defender: Pokemon) -> Tuple[int, int]:
+    """Average outcome of `move` on `defender` for the look-ahead AI: (damage, extra burn damage)."""
+    if move.power <= 0:
+        return 0, 0
+    hit = 1.0 if move.accuracy >= 100 else move.accuracy * 0.01
+    mult = type_multiplier(move.mtype_id, defender.ptype_id)
+    dmg = max(1.0, move.power * (1 + 0.5 * CRIT_CHANCE) * mult)
+    burn = BURN_CHANCE * BURN_TURNS * BURN_DAMAGE if move.mtype_id == _FIRE else 0.0
+    return round(hit * dmg), round(hit * burn)
 
 
-def choose_enemy_move(p: Pokemon) -> Move:
-    weighted = [m for m in p.moves for _ in (range(2) if m.mtype != "Normal" else range(1))]
-    return random.choice(weighted)
+def ai_state(enemy: Pokemon, player: Pokemon) -> ai.AIState:
+    """The matchup in the form the look-ahead AI searches, from the enemy's side."""
+    return ai.AIState(enemy.hp, enemy.max_hp, enemy.burn, tuple(expected_damage(m, player) for m in enemy.moves),
+                      player.hp, player.max_hp, player.burn, tuple(expected_damage(m, enemy) for m in player.moves),
+                      BURN_DAMAGE)
+
+
+def deal_damage_batch(defender: Pokemon, move: Move, n: int, rng: random.Random = _rng) -> List[int]:
+    """Sample n damage rolls (0 on a miss) without touching HP; for expected-damage estimates."""
+    mult = type_multiplier(move.mtype_id, defender.ptype_id)
+    power, accuracy = move.power, move.accuracy
+    return [roll_damage(power, accuracy, mult, rng)[1] for _ in range(n)]
 
 
 # ---------- Manual DB loader ----------
 def load_manual_db(path: str) -> Optional[List[Pokemon]]:
     """Load Pokémon list from a simple JSON DB. Returns None on failure."""
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+    mons = _load_manual_db_cached(path, mtime)
+    return list(mons) if mons else None
+
+
+@functools.lru_cache(maxsize=4)
+def _load_manual_db_cached(path: str, mtime: float) -> Optional[List[Pokemon]]:
+    """Parse the DB; keyed on mtime so an edited file is re-read."""
+    try:
+        with open(path, "rb") as f:
+            data = _loads(f.read())
     except Exception:
         return None
 
@@ -106,11 +256,12 @@ def load_manual_db(path: str) -> Optional[List[Pokemon]]:
         return None
 
     mons: List[Pokemon] = []
+    interned: dict = {}  # Move is frozen and hashable, so equal moves can share one object
     for entry in mons_raw:
         try:
             name = str(entry.get("name", "Unknown"))
             ptype = str(entry.get("type", "Normal")).capitalize()
-            hp = int(entry.get("hp", 60))
+            hp = max(1, int(entry.get("hp", 60)))  # format_hp divides by max_hp
             moves_raw = entry.get("moves", [])
             mv_objs: List[Move] = []
             for mv in moves_raw:
@@ -118,11 +269,13 @@ def load_manual_db(path: str) -> Optional[List[Pokemon]]:
                 mv_type = str(mv.get("type", "Normal")).capitalize()
                 mv_power = int(mv.get("power", 10))
                 mv_acc = int(mv.get("accuracy", 100))
-                mv_objs.append(Move(mv_name, mv_type, mv_power, mv_acc))
+                move = Move(mv_name, mv_type, mv_power, mv_acc)
+                mv_objs.append(interned.setdefault(move, move))
             # Require at least 3 moves; pad with basic moves if needed
             while len(mv_objs) < 3:
-                mv_objs.append(Move("Tackle", "Normal", 10, 100))
-            mons.append(Pokemon(name=name, ptype=ptype, max_hp=hp, hp=hp, moves=mv_objs[:3]))
+                move = Move("Tackle", "Normal", 10, 100)
+                mv_objs.append(interned.setdefault(move, move))
+            mons.append(Pokemon(name=name, ptype=ptype, max_hp=hp, hp=hp, moves=tuple(mv_objs[:3])))
         except Exception:
             # Skip malformed entries
             continue
@@ -130,65 +283,120 @@ def load_manual_db(path: str) -> Optional[List[Pokemon]]:
     return mons or None
 
 
-def build_battle_entities_from_db(db_mons: List[Pokemon]) -> Tuple[List[Pokemon], Pokemon]:
+def build_battle_entities_from_db(db_mons: List[Pokemon], rng: random.Random = _rng) -> Tuple[List[Pokemon], Pokemon]:
     """Select a party of 2 and 1 enemy from DB mons."""
     if len(db_mons) < 3:
         raise ValueError("DB too small for battle")
-    p1, p2, enemy = random.sample(db_mons, 3)
+    p1, p2, enemy = _pick_k(db_mons, 3, rng)
     party = [clone_pokemon(p1), clone_pokemon(p2)]
     return party, clone_pokemon(enemy)
 
 
 # ---------- GUI ----------
+# Data files, resolved once at import
+_DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data"))
+_DB_PATH = os.path.join(_DATA_DIR, "pokedex_min.json")
+_RECORD_PATH = os.path.join(_DATA_DIR, "record.json")
+
+_BAR_LEN = 20
+# ASCII cells render on Tk's plain Courier path; block glyphs need font fallback on each redraw
+_BAR_FULL = "#" * _BAR_LEN
+_BAR_EMPTY = "-" * _BAR_LEN
+# Every possible HP bar, indexed by the number of filled cells
+_BARS = tuple(_BAR_FULL[:i] + _BAR_EMPTY[:_BAR_LEN - i] for i in range(_BAR_LEN + 1))
+
+
+# Log suffix keyed by (crit, effectiveness bucket: -1 resisted, 0 neutral, 1 super effective)
+_RESULT_SUFFIX = {
+    (False, -1): " Not very effective...",
+    (False, 0): "",
+    (False, 1): " Super effective!",
+    (True, -1): " Critical hit! Not very effective...",
+    (True, 0): " Critical hit!",
+    (True, 1): " Critical hit! Super effective!",
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _hp_prefix(label: str, name: str, ptype: str) -> str:
+    """The part of an HP line that never changes mid-battle."""
+    return f"{label}: {name:<10} [{ptype}] "
+
+
 class BattleApp:
-    def __init__(self, root: tk.Tk) -> None:
+    def __init__(self, root: tk.Tk, headless: bool = False) -> None:
         self.root = root
         root.title("Pokemon Battle - Manual DB (Best of 3)")
         root.resizable(False, False)
 
+        # Pacing (ms) between player action, enemy reply and next round. Headless mode drops
+        # the delays and runs scheduled callbacks inline so matches can be driven at full speed.
+        self.headless = headless
+        self.action_delay_ms = 0 if headless else 600  # after a potion or switch
+        self.turn_delay_ms = 0 if headless else 700    # after an attack
+        self.round_delay_ms = 0 if headless else 1800
+        self._after = (lambda ms, cb: cb()) if headless else root.after
+        self._after_idle = (lambda cb: cb()) if headless else root.after_idle
+
         # Match state
         self.player_wins = 0
         self.enemy_wins = 0
         self.round_num = 0
+        self._round_ended = False  # set by _end_round, cleared by start_new_round
+
+        # Per-app RNG; set BATTLE_SEED for a reproducible game
+        self._rng = random.Random(os.environ.get("BATTLE_SEED"))
 
         # Manual DB load
-        base = os.path.dirname(__file__)
-        data_dir = os.path.abspath(os.path.join(base, "..", "data"))
-        os.makedirs(data_dir, exist_ok=True)
-        db_path = os.path.join(data_dir, "pokedex_min.json")
-        self.db_mons = load_manual_db(db_path)
+        os.makedirs(_DATA_DIR, exist_ok=True)
+        self.db_mons = load_manual_db(_DB_PATH)
         self.used_db = self.db_mons is not None and isinstance(self.db_mons, list) and len(self.db_mons) >= 3
 
         source_pool = self.db_mons if self.used_db else ROSTER  # type: ignore[arg-type]
-        p1, p2 = random.sample(source_pool, 2)
+        p1, p2 = _pick_k(source_pool, 2, self._rng)
         self.party_templates: List[Pokemon] = [p1, p2]
+        # Enemy candidates exclude the party; the party never changes, so build once. Each candidate
+        # gets one battle copy up front that start_new_round resets rather than re-cloning.
+        party_names = (p1.name, p2.name)
+        self._enemy_pool: List[Pokemon] = [clone_pokemon(m) for m in source_pool if m.name not in party_names] \
+            or [clone_pokemon(m) for m in source_pool]
         self.party: List[Pokemon] = [clone_pokemon(p1), clone_pokemon(p2)]
         self.active_idx = 0
         self.player: Pokemon = self.party[self.active_idx]
         # Placeholder enemy (re-chosen each round in start_new_round)
-        self.enemy: Pokemon = clone_pokemon(random.choice(source_pool))
+        self.enemy: Pokemon = clone_pokemon(self._rng.choice(source_pool))
         self.potion_count = 2
         # Persistent record
         self.record = self.load_record()
+        self._record_dirty = False  # set when a match result changes the record, cleared once saved
+        # Last (pokemon, hp, burn) drawn on each HP label
+        self._last_player: Optional[tuple] = None
+        self._last_enemy: Optional[tuple] = None
+        self._display_dirty = False  # HP labels need a refresh on the next UI flush
 
         # Title & score
         self.lbl_title = tk.Label(root, text="", font=("Arial", 14, "bold"), fg="#2c3e50")
         self.lbl_title.pack(pady=10)
-        self.lbl_score = tk.Label(root, text="", font=("Arial", 12, "italic"), fg="#34495e")
+        self.score_var = tk.StringVar(value="")
+        self.lbl_score = tk.Label(root, textvariable=self.score_var, font=("Arial", 12, "italic"), fg="#34495e")
         self.lbl_score.pack(pady=(0, 6))
         # Record label
-        self.lbl_record = tk.Label(root, text="", font=("Arial", 11), fg="#7f8c8d")
+        self.record_var = tk.StringVar(value="")
+        self.lbl_record = tk.Label(root, textvariable=self.record_var, font=("Arial", 11), fg="#7f8c8d")
         self.lbl_record.pack(pady=(0, 6))
 
         # HP Display
         hp_frame = tk.Frame(root)
         hp_frame.pack(pady=5)
 
-        self.lbl_player_hp = tk.Label(hp_frame, text=self.format_hp(self.player, "You"),
+        # HP labels are driven through StringVars; setting one skips .config option parsing
+        self.player_hp_var = tk.StringVar(value=self.format_hp(self.player, "You"))
+        self.lbl_player_hp = tk.Label(hp_frame, textvariable=self.player_hp_var,
                                       font=("Courier", 11), fg="#e74c3c", anchor="w", width=40)
         self.lbl_player_hp.pack()
 
-        self.lbl_enemy_hp = tk.Label(hp_frame, text=self.format_hp(self.enemy, "Foe"),
+        self.enemy_hp_var = tk.StringVar(value=self.format_hp(self.enemy, "Foe"))
+        self.lbl_enemy_hp = tk.Label(hp_frame, textvariable=self.enemy_hp_var,
                                      font=("Courier", 11), fg="#3498db", anchor="w", width=40)
         self.lbl_enemy_hp.pack()
 
@@ -196,6 +404,10 @@ class BattleApp:
         self.txt_log = tk.Text(root, height=10, width=50, wrap=tk.WORD, state=tk.DISABLED,
                                font=("Arial", 10), bg="#ecf0f1")
         self.txt_log.pack(pady=10, padx=10)
+        # Pending log lines, flushed in one insert by _flush_ui
+        self._log_buf: collections.deque = collections.deque()
+        self._log_clear = False  # wipe the widget on the next flush
+        self._ui_scheduled = False  # a _flush_ui is queued for idle time
 
         # Move buttons
         btn_frame = tk.Frame(root)
@@ -208,6 +420,7 @@ class BattleApp:
                             width=15, height=3, font=("Arial", 9))
             btn.grid(row=0, column=i, padx=5)
             self.move_buttons.append(btn)
+        self._button_moves = self.player.moves  # moves currently shown on the buttons
 
         # Action buttons
         action_frame = tk.Frame(root)
@@ -226,32 +439,31 @@ class BattleApp:
                                      width=15, font=("Arial", 9), bg="#27ae60", fg="white")
         self.btn_restart.grid(row=0, column=2, padx=5)
 
-        # Keyboard hotkeys
-        root.bind("1", lambda e: self.on_move_click(0))
-        root.bind("2", lambda e: self.on_move_click(1))
-        root.bind("3", lambda e: self.on_move_click(2))
-        root.bind("p", lambda e: self.on_potion())
-        root.bind("P", lambda e: self.on_potion())
-        root.bind("s", lambda e: self.on_switch())
-        root.bind("S", lambda e: self.on_switch())
-        root.bind("r", lambda e: self.restart())
-        root.bind("R", lambda e: self.restart())
+        # Keyboard hotkeys: one <Key> binding dispatched through a table (keysyms lower-cased, so P/p both work)
+        self._keymap: Dict[str, Callable[[], None]] = {
+            "1": lambda: self.on_move_click(0),
+            "2": lambda: self.on_move_click(1),
+            "3": lambda: self.on_move_click(2),
+            "p": self.on_potion,
+            "s": self.on_switch,
+            "r": self.restart,
+        }
+        root.bind("<Key>", self._on_key)
 
         self.update_record_label()
         # Start match
         self.restart()
 
-    # ---------- Persistence ----------
-    def record_path(self) -> str:
-        base = os.path.dirname(__file__)
-        data_dir = os.path.abspath(os.path.join(base, "..", "data"))
-        os.makedirs(data_dir, exist_ok=True)
-        return os.path.join(data_dir, "record.json")
+    def _on_key(self, event: tk.Event) -> None:
+        action = self._keymap.get(event.keysym.lower())
+        if action is not None:
+            action()
 
+    # ---------- Persistence ----------
     def load_record(self) -> dict:
         try:
-            with open(self.record_path(), "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(_RECORD_PATH, "rb") as f:
+                data = _loads(f.read())
                 if isinstance(data, dict):
                     return {"wins": int(data.get("wins", 0)), "losses": int(data.get("losses", 0)), "ties": int(data.get("ties", 0))}
         except Exception:
@@ -259,67 +471,115 @@ class BattleApp:
         return {"wins": 0, "losses": 0, "ties": 0}
 
     def save_record(self) -> None:
+        if not self._record_dirty:
+            return
+        # Write a sibling temp file and swap it in, so a crash mid-write never leaves a truncated record
+        tmp = _RECORD_PATH + ".tmp"
         try:
-            with open(self.record_path(), "w", encoding="utf-8") as f:
-                json.dump(self.record, f)
+            with open(tmp, "wb") as f:
+                f.write(_dumps(self.record))
+            os.replace(tmp, _RECORD_PATH)
+            self._record_dirty = False
         except Exception:
             pass
 
     def update_record_label(self) -> None:
-        self.lbl_record.config(text=f"Record: {self.record['wins']}W/{self.record['losses']}L/{self.record['ties']}T")
+        self.record_var.set(f"Record: {self.record['wins']}W/{self.record['losses']}L/{self.record['ties']}T")
 
     def update_score_label(self) -> None:
-        self.lbl_score.config(text=f"Score: You {self.player_wins} - {self.enemy_wins} Foe")
+        self.score_var.set(f"Score: You {self.player_wins} - {self.enemy_wins} Foe")
 
     def format_hp(self, pokemon: Pokemon, label: str) -> str:
-        hp_percent = pokemon.hp / pokemon.max_hp if pokemon.max_hp > 0 else 0
-        bar_length = 20
-        filled = int(bar_length * hp_percent)
-        bar = "█" * filled + "░" * (bar_length - filled)
+        filled = (pokemon.hp * _BAR_LEN) // pokemon.max_hp
+        bar = _BARS[filled]
         burn_status = " (BRN)" if pokemon.burn > 0 else ""
-        return f"{label}: {pokemon.name:<10} [{pokemon.ptype}] {bar} {pokemon.hp}/{pokemon.max_hp} HP{burn_status}"
+        return f"{_hp_prefix(label, pokemon.name, pokemon.ptype)}{bar} {pokemon.hp}/{pokemon.max_hp} HP{burn_status}"
 
     def log_message(self, message: str) -> None:
+        """Queue a log line; queued lines are written together once Tk is idle."""
+        self._log_buf.append(message)
+        self._schedule_ui()
+
+    def _schedule_ui(self) -> None:
+        if not self._ui_scheduled:
+            self._ui_scheduled = True
+            self._after_idle(self._flush_ui)
+
+    def _flush_ui(self) -> None:
+        """Apply everything queued since the last flush: HP labels, then the log in one insert."""
+        self._ui_scheduled = False
+        if self._display_dirty:
+            self._display_dirty = False
+            self._refresh_hp_labels()
+        if not self._log_buf and not self._log_clear:
+            return
         self.txt_log.config(state=tk.NORMAL)
-        self.txt_log.insert(tk.END, message + "\n")
-        self.txt_log.see(tk.END)
+        if self._log_clear:
+            self.txt_log.delete(1.0, tk.END)
+            self._log_clear = False
+        # A flush can carry only the clear (headless flushes inline, before the round's first line)
+        if self._log_buf:
+            self.txt_log.insert(tk.END, "\n".join(self._log_buf) + "\n")
+            self.txt_log.see(tk.END)
+            self._log_buf.clear()
         self.txt_log.config(state=tk.DISABLED)
 
     def start_new_round(self) -> None:
         # Increment round
         self.round_num += 1
+        self._round_ended = False
         # Reset party & enemy
-        self.party = [clone_pokemon(t) for t in self.party_templates]
+        for p in self.party:
+            reset_pokemon(p)
         self.active_idx = 0
         self.player = self.party[self.active_idx]
         # Reset potions
         self.potion_count = 2
         self.btn_potion.config(text=f"Potion (+15 HP) [{self.potion_count}]", state=tk.NORMAL)
         # Enemy selection
-        pool = self.db_mons if self.used_db and self.db_mons else ROSTER
-        enemy_candidates = [m for m in pool if m.name not in {t.name for t in self.party_templates}] or pool
-        self.enemy = clone_pokemon(random.choice(enemy_candidates))
+        self.enemy = self._rng.choice(self._enemy_pool)
+        reset_pokemon(self.enemy)
         db_note = " [DB]" if self.used_db else ""
         self.lbl_title.config(text=f"Round {self.round_num} - A wild {self.enemy.name} appeared!{db_note}")
         self.update_score_label()
-        # Update move buttons
-        for i, mv in enumerate(self.player.moves):
-            if i < len(self.move_buttons):
-                self.move_buttons[i].config(text=f"{mv.name}\n({mv.mtype} {mv.power})",
-                                            command=lambda idx=i: self.on_move_click(idx))
-        # Clear log
-        self.txt_log.config(state=tk.NORMAL)
-        self.txt_log.delete(1.0, tk.END)
-        self.txt_log.config(state=tk.DISABLED)
+        self.update_move_buttons()
+        # Clear log (including lines not yet flushed); done by the next flush, together with the new round's lines
+        self._log_buf.clear()
+        self._log_clear = True
         self.update_display()
-        self.open_choice_dialog()
+        if not self.headless:
+            self.open_choice_dialog()
         self.log_message("Battle started! Choose your move...")
         self.log_message("Hotkeys: 1-3 (moves), P (potion), S (switch), R (restart)")
         self.enable_moves()
 
+    def update_move_buttons(self) -> None:
+        """Relabel the move buttons for the active Pokemon; their commands are bound once in __init__."""
+        # Clones share their template's moves tuple, so identity tells us whether the labels would change
+        if self.player.moves is self._button_moves:
+            return
+        self._button_moves = self.player.moves
+        for btn, mv in zip(self.move_buttons, self.player.moves):
+            btn.config(text=f"{mv.name}\n({mv.mtype} {mv.power})")
+
     def update_display(self) -> None:
-        self.lbl_player_hp.config(text=self.format_hp(self.player, "You"))
-        self.lbl_enemy_hp.config(text=self.format_hp(self.enemy, "Foe"))
+        """Schedule an HP label refresh; repeated calls within one event coalesce into a single redraw."""
+        self._display_dirty = True
+        self._schedule_ui()
+
+    def _refresh_hp_labels(self) -> None:
+        # Only touch a label when what it shows has changed: same Pokémon object (so name, type and
+        # max HP are unchanged) with the same HP and burn
+        p = self.player
+        last = self._last_player
+        if last is None or last[0] is not p or last[1] != p.hp or last[2] != p.burn:
+            self.player_hp_var.set(self.format_hp(p, "You"))
+            self._last_player = (p, p.hp, p.burn)
+        p = self.enemy
+        last = self._last_enemy
+        if last is None or last[0] is not p or last[1] != p.hp or last[2] != p.burn:
+            self.enemy_hp_var.set(self.format_hp(p, "Foe"))
+            self._last_enemy = (p, p.hp, p.burn)
 
     def disable_moves(self) -> None:
         for btn in self.move_buttons:
@@ -334,20 +594,13 @@ class BattleApp:
         if self.potion_count > 0:
             self.btn_potion.config(state=tk.NORMAL)
 
-    def describe_result(self, attacker: Pokemon, move: Move, result: dict, target: str) -> str:
-        if result["missed"]:
+    def describe_result(self, attacker: Pokemon, move: Move, result: DamageResult, target: str) -> str:
+        if result.missed:
             return f"{attacker.name} used {move.name}, but it missed!"
 
-        parts = []
-        if result["crit"]:
-            parts.append("Critical hit!")
-        if result["mult"] > 1.0:
-            parts.append("Super effective!")
-        elif 0 < result["mult"] < 1.0:
-            parts.append("Not very effective...")
-
-        extra = " " + " ".join(parts) if parts else ""
-        return f"{attacker.name} used {move.name}! Dealt {result['damage']} damage to {target}.{extra}"
+        bucket = (result.mult > 1.0) - (0 < result.mult < 1.0)
+        extra = _RESULT_SUFFIX[(result.crit, bucket)]
+        return f"{attacker.name} used {move.name}! Dealt {result.damage} damage to {target}.{extra}"
 
     def on_switch(self) -> None:
         """Allow player to switch to another Pokemon in their party."""
@@ -373,14 +626,8 @@ class BattleApp:
             self.player = self.party[self.active_idx]
             self.log_message(f"You switched to {self.player.name}!")
             self.update_display()
-            # Update move buttons for new Pokemon
-            for i, move in enumerate(self.player.moves):
-                if i < len(self.move_buttons):
-                    self.move_buttons[i].config(
-                        text=f"{move.name}\n({move.mtype} {move.power})",
-                        command=lambda idx=i: self.on_move_click(idx)
-                    )
-            self.root.after(600, self.enemy_turn)
+            self.update_move_buttons()
+            self._after(self.action_delay_ms, self.enemy_turn)
 
         for idx, poke in options:
             btn_text = f"{poke.name} ({poke.hp}/{poke.max_hp} HP)"
@@ -398,7 +645,8 @@ class BattleApp:
         self.disable_moves()
 
         old_hp = self.player.hp
-        self.player.hp = clamp(self.player.hp + 15, 0, self.player.max_hp)
+        h = old_hp + 15
+        self.player.hp = h if h < self.player.max_hp else self.player.max_hp
         healed = self.player.hp - old_hp
 
         self.potion_count -= 1
@@ -411,43 +659,44 @@ class BattleApp:
             self.btn_potion.config(state=tk.DISABLED)
 
         # Enemy turn after using potion
-        self.root.after(600, self.enemy_turn)
+        self._after(self.action_delay_ms, self.enemy_turn)
 
     def on_move_click(self, move_idx: int) -> None:
         if self.player.hp <= 0 or self.enemy.hp <= 0:
             return
         self.disable_moves()
-        burn_dmg = apply_burn(self.player)
+        # Most turns nobody is burned; skip the call entirely then
+        burn_dmg = apply_burn(self.player) if self.player.burn > 0 else 0
         if burn_dmg > 0:
             self.log_message(f"{self.player.name} is hurt by burn (-{burn_dmg}).")
             self.update_display()
             if self.player.hp <= 0 and self._end_round_if_needed():
                 return
         move = self.player.moves[move_idx]
-        result = deal_damage(self.player, self.enemy, move)
+        result = deal_damage(self.player, self.enemy, move, self._rng)
         msg = self.describe_result(self.player, move, result, self.enemy.name)
-        if result.get("burned"):
+        if result.burned:
             msg += f" {self.enemy.name} was burned!"
         self.log_message(msg)
         self.update_display()
         if self._end_round_if_needed():
             return
-        self.root.after(700, self.enemy_turn)
+        self._after(self.turn_delay_ms, self.enemy_turn)
 
     def enemy_turn(self) -> None:
-        if self.enemy.hp <= 0 or self.player.hp <= 0:
-            if self._end_round_if_needed():
-                return
-        burn_dmg = apply_burn(self.enemy)
+        # Callers already ran the end-of-round check before scheduling this turn
+        if self._round_ended:
+            return
+        burn_dmg = apply_burn(self.enemy) if self.enemy.burn > 0 else 0
         if burn_dmg > 0:
             self.log_message(f"{self.enemy.name} is hurt by burn (-{burn_dmg}).")
             self.update_display()
             if self._end_round_if_needed():
                 return
-        move = choose_enemy_move(self.enemy)
-        result = deal_damage(self.enemy, self.player, move)
+        move = self.enemy.moves[ai.best_move(self.snapshot_state())]
+        result = deal_damage(self.enemy, self.player, move, self._rng)
         msg = self.describe_result(self.enemy, move, result, self.player.name)
-        if result.get("burned"):
+        if result.burned:
             msg += f" {self.player.name} was burned!"
         self.log_message(msg)
         self.update_display()
@@ -455,6 +704,10 @@ class BattleApp:
             return
         self.enable_moves()
 
+    def snapshot_state(self) -> ai.AIState:
+        """The current matchup in the form the look-ahead AI searches; enemy_turn takes it after the enemy's burn tick."""
+        return ai_state(self.enemy, self.player)
+
     def restart(self) -> None:
         # Reset match
         self.player_wins = 0
@@ -463,6 +716,8 @@ class BattleApp:
         self.start_new_round()
 
     def _end_round_if_needed(self) -> bool:
+        if self._round_ended:
+            return True
         all_party_fainted = all(p.hp <= 0 for p in self.party)
         enemy_fainted = self.enemy.hp <= 0
         if enemy_fainted and all_party_fainted:
@@ -480,6 +735,7 @@ class BattleApp:
         return False
 
     def _end_round(self, player_won: bool | None) -> None:
+        self._round_ended = True
         if player_won is True:
             self.player_wins += 1
         elif player_won is False:
@@ -489,17 +745,19 @@ class BattleApp:
         if self.player_wins >= 2:
             self.log_message("\n🏆 You won the match! Congratulations! 🏆")
             self.record['wins'] += 1
+            self._record_dirty = True
             self.save_record()
             self.update_record_label()
             return
         if self.enemy_wins >= 2:
             self.log_message("\n💔 You lost the match! Better luck next time. 💔")
             self.record['losses'] += 1
+            self._record_dirty = True
             self.save_record()
             self.update_record_label()
             return
         self.log_message("Prepare for the next round...")
-        self.root.after(1800, self.start_new_round)
+        self._after(self.round_delay_ms, self.start_new_round)
 
     def open_choice_dialog(self) -> None:
         win = tk.Toplevel(self.root)
@@ -511,10 +769,7 @@ class BattleApp:
         def choose(idx: int) -> None:
             self.active_idx = idx
             self.player = self.party[self.active_idx]
-            for i, mv in enumerate(self.player.moves):
-                if i < len(self.move_buttons):
-                    self.move_buttons[i].config(text=f"{mv.name}\n({mv.mtype} {mv.power})",
-                                                command=lambda idx=i: self.on_move_click(idx))
+            self.update_move_buttons()
             db_note = " [DB]" if self.used_db else ""
             self.lbl_title.config(text=f"A wild {self.enemy.name} appeared! Go {self.player.name}!{db_note}")
             self.update_display()
@@ -0,0 +1,215 @@
+import random
+import sys
+from array import array
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import ai
+from pokemon_battle import (
+    BURN_CHANCE, BURN_DAMAGE, BURN_TURNS, CRIT_CHANCE, ROSTER, Move, Pokemon, PType,
+    _rng, expected_damage, roll_damage, type_multiplier,
+)
+
+# ---------- Headless battle simulation (balance tuning, no GUI) ----------
+
+MAX_TURNS = 200  # safety cap for matchups that cannot finish (e.g. 0-power moves)
+TIE = 2          # BattleArray.winner value for a tie; -1 means still running
+I16_MAX = 32767  # stat columns are int16; larger stats are saturated on load
+MOVE_SLOTS = 4   # move slots per Pokémon in RosterArrays
+
+
+def quantize(p: float) -> int:
+    """Odds p as a threshold on a random byte: `byte < quantize(p)` holds with probability ~p (1/256 steps)."""
+    return round(p * 256)
+
+
+CRIT_U8 = quantize(CRIT_CHANCE)  # 26/256 ~ 10.2%
+
+
+def batch_deal(defender: Pokemon, move: Move, n: int, rng: random.Random = _rng) -> List[int]:
+    """Roll n independent attacks (0 on a miss) from byte-quantized odds; HP is not touched.
+
+    Coarser than deal_damage_batch but cheaper: every roll is one byte from a single randbytes() call,
+    compared against an integer threshold, with no float draws at all.
+    """
+    if move.power <= 0:
+        return [0] * n
+    mult = type_multiplier(move.mtype_id, defender.ptype_id)
+    hit_u8 = quantize(move.accuracy * 0.01)  # 256 for sure-hit moves: every byte passes
+    base0 = move.power - 2
+    raw = rng.randbytes(3 * n)
+    out = []
+    for hit, var, crit in zip(raw[:n], raw[n:2 * n], raw[2 * n:]):
+        if hit >= hit_u8:
+            out.append(0)
+            continue
+        base = base0 + (var * 5 >> 8)  # byte -> jitter bucket 0..4
+        if crit < CRIT_U8:
+            base = int(base * 1.5)
+        out.append(max(1, int(base * mult)))
+    return out
+
+
+def _i16(n: int) -> int:
+    return max(-I16_MAX, min(n, I16_MAX))
+
+
+class RosterArrays:
+    """Roster templates stored column-wise, indexed by roster position.
+
+    Move columns hold MOVE_SLOTS entries per Pokémon (index mon * MOVE_SLOTS + k); unused slots are
+    padded with power 0. `move_mult[(mon * MOVE_SLOTS + k) * n + foe]` is that move's type multiplier
+    against roster Pokémon `foe`, precomputed so battles never look types up. `move_values[mon * n + foe]`
+    holds the look-ahead AI's expected (damage, burn) per real move of `mon` against `foe`.
+    """
+
+    def __init__(self, roster: Sequence[Pokemon]) -> None:
+        self.n = len(roster)
+        self.names = [p.name for p in roster]
+        self.ptype_ids = array("b", (p.ptype_id for p in roster))
+        self.max_hp = array("h", (min(p.max_hp, I16_MAX) for p in roster))
+        self.move_power = array("h")
+        self.move_acc = array("h")
+        self.move_burns = array("b")  # 1 if the move can inflict burn
+        self.move_mult = array("d")
+        # Random-AI pick lists of move slots: typed moves count twice, Normal moves once
+        self.weighted: List[Tuple[int, ...]] = []
+        self.move_values = [tuple(expected_damage(mv, foe) for mv in p.moves[:MOVE_SLOTS]) for p in roster for foe in roster]
+        for p in roster:
+            moves = p.moves[:MOVE_SLOTS]
+            picks: List[int] = []
+            for k in range(MOVE_SLOTS):
+                if k < len(moves):
+                    mv = moves[k]
+                    self.move_power.append(_i16(mv.power))
+                    self.move_acc.append(_i16(mv.accuracy))
+                    self.move_burns.append(mv.mtype_id == PType.FIRE)
+                    self.move_mult.extend(type_multiplier(mv.mtype_id, foe.ptype_id) for foe in roster)
+                    picks.extend([k] * (2 if mv.mtype != "Normal" else 1))
+                else:
+                    self.move_power.append(0)
+                    self.move_acc.append(100)
+                    self.move_burns.append(0)
+                    self.move_mult.extend([1.0] * self.n)
+            self.weighted.append(tuple(picks))
+
+
+Policy = Callable[["BattleArray", int, int], int]  # (battle, side, slot) -> move slot for that side to use
+
+
+def minimax_policy(battle: "BattleArray", side: int, i: int) -> int:
+    """The game's enemy AI: ai.best_move on battle slot i, from `side`'s point of view."""
+    roster = battle.roster
+    me, foe = battle.mon[side][i], battle.mon[1 - side][i]
+    state = ai.AIState(battle.hp[side][i], roster.max_hp[me], battle.burn[side][i],
+                       roster.move_values[me * roster.n + foe],
+                       battle.hp[1 - side][i], roster.max_hp[foe], battle.burn[1 - side][i],
+                       roster.move_values[foe * roster.n + me],
+                       BURN_DAMAGE)
+    return ai.best_move(state)
+
+
+def weighted_policy(battle: "BattleArray", side: int, i: int) -> int:
+    """The older weighted random AI: typed moves are twice as likely as Normal ones."""
+    return battle.rng.choice(battle.roster.weighted[battle.mon[side][i]])
+
+
+class BattleArray:
+    """Many independent 1v1 battles stored column-wise: one array per stat, indexed by battle slot.
+
+    Each battle is a pair of RosterArrays indices; side 0 moves first. Only the mutable state (HP, burn)
+    lives here, everything static is read from the roster columns.
+    """
+
+    def __init__(self, roster: RosterArrays, pairs: Sequence[Tuple[int, int]],
+                 policy: Policy = minimax_policy, rng: Optional[random.Random] = None) -> None:
+        self.roster = roster
+        self.policy = policy
+        self.rng = rng if rng is not None else _rng
+        self.n = len(pairs)
+        self.mon = (array("h", (a for a, _ in pairs)), array("h", (b for _, b in pairs)))
+        # int16 columns: HP and burn both fit, at half the memory of int32
+        self.hp = (array("h", (roster.max_hp[m] for m in self.mon[0])), array("h", (roster.max_hp[m] for m in self.mon[1])))
+        self.burn = (array("h", [0]) * self.n, array("h", [0]) * self.n)
+        self.winner = array("b", [-1]) * self.n
+        self.live = list(range(self.n))
+
+    def step(self, side: int) -> None:
+        """Let `side` take its turn in every battle still running, then settle finished ones."""
+        hp_a, hp_d = self.hp[side], self.hp[1 - side]
+        burn_a, burn_d = self.burn[side], self.burn[1 - side]
+        mon_a, mon_d = self.mon[side], self.mon[1 - side]
+        roster = self.roster
+        power, acc, mult, burns = roster.move_power, roster.move_acc, roster.move_mult, roster.move_burns
+        n_mons = roster.n
+        policy = self.policy
+        rng = self.rng
+        rand = rng.random
+        still = []
+        winner = self.winner
+        for i in self.live:
+            # One fused pass per battle: load the HP pair once, apply burn, attack, clamp and
+            # settle the result on locals, and store each column at most once
+            ha, hd = hp_a[i], hp_d[i]
+            if burn_a[i] > 0:
+                burn_a[i] -= 1
+                ha = ha - BURN_DAMAGE if ha > BURN_DAMAGE else 0
+                hp_a[i] = ha
+            if ha > 0:
+                m = mon_a[i]
+                k = m * MOVE_SLOTS + policy(self, side, i)
+                _, dmg, _ = roll_damage(power[k], acc[k], mult[k * n_mons + mon_d[i]], rng)
+                if dmg > 0:
+                    hd = hd - dmg if hd > dmg else 0
+                    hp_d[i] = hd
+                    if burns[k] and hd > 0 and burn_d[i] == 0 and rand() < BURN_CHANCE:
+                        burn_d[i] = BURN_TURNS
+            if hd <= 0:
+                winner[i] = TIE if ha <= 0 else side
+            elif ha <= 0:
+                winner[i] = 1 - side
+            else:
+                still.append(i)
+        self.live = still
+
+    def run(self, max_turns: int = MAX_TURNS) -> Tuple[int, int, int]:
+        """Play every battle out. Returns side 0's (wins, losses, ties); battles hitting the cap count as ties."""
+        for turn in range(max_turns):
+            if not self.live:
+                break
+            self.step(turn % 2)
+        for i in self.live:
+            self.winner[i] = TIE
+        self.live = []
+        return self.winner.count(0), self.winner.count(1), self.winner.count(TIE)
+
+
+def simulate_match_batch(player_idx: int, enemy_idx: int, policy: Policy = minimax_policy, n: int = 1000,
+                         roster: Optional[RosterArrays] = None,
+                         rng: Optional[random.Random] = None) -> Tuple[int, int, int]:
+    """Run n battles of roster[player_idx] (moving first) against roster[enemy_idx]. Returns (wins, losses, ties)."""
+    roster = roster or ROSTER_ARRAYS
+    return BattleArray(roster, [(player_idx, enemy_idx)] * n, policy, rng).run()
+
+
+def simulate(n_battles: int, roster: Optional[List[Pokemon]] = None) -> Dict[Tuple[str, str], Tuple[int, int, int]]:
+    """Run n_battles for every ordered pairing. Maps (first, second) names to (wins, losses, ties) of `first`."""
+    arrays = RosterArrays(roster) if roster else ROSTER_ARRAYS
+    results: Dict[Tuple[str, str], Tuple[int, int, int]] = {}
+    for a in range(arrays.n):
+        for b in range(arrays.n):
+            if a != b:
+                results[(arrays.names[a], arrays.names[b])] = simulate_match_batch(a, b, n=n_battles, roster=arrays)
+    return results
+
+
+ROSTER_ARRAYS = RosterArrays(ROSTER)
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    for (a, b), (w, l, t) in simulate(n).items():
+        print(f"{a:<10} vs {b:<10} {w / n:6.1%} W  {l / n:6.1%} L  {t / n:6.1%} T")
+
+
+if __name__ == "__main__":
+    main()
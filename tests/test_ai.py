@@ -0,0 +1,42 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import ai
+from pokemon_battle import ROSTER, Pokemon, ai_state, apply_burn, clone_pokemon
+
+CHARMANDER, SQUIRTLE, BULBASAUR = ROSTER
+
+
+class BestMoveTest(unittest.TestCase):
+    def pick(self, enemy, player) -> str:
+        return enemy.moves[ai.best_move(ai_state(enemy, player))].name
+
+    def test_prefers_super_effective_move(self):
+        # Fresh matchups, no burn involved: the typed move that hits for 2x wins out
+        self.assertEqual(self.pick(clone_pokemon(CHARMANDER), clone_pokemon(BULBASAUR)), "Ember")
+        self.assertEqual(self.pick(clone_pokemon(SQUIRTLE), clone_pokemon(CHARMANDER)), "Water Gun")
+
+    def test_takes_a_sure_knockout(self):
+        # Against a resisting type Tackle (10, sure hit) outdamages Water Gun (14 x 0.5) and KOs at 9 HP;
+        # the moves are reversed so Tackle is the last slot, not the tie-break default
+        enemy = Pokemon(SQUIRTLE.name, SQUIRTLE.ptype, SQUIRTLE.max_hp, SQUIRTLE.max_hp, SQUIRTLE.moves[::-1])
+        player = clone_pokemon(BULBASAUR)
+        player.hp = 9
+        self.assertEqual(self.pick(enemy, player), "Tackle")
+
+    def test_burn_already_ticked_is_not_counted_again(self):
+        # A burned Charmander at 4 HP ticks to 2 HP at the start of its turn; it still gets to attack,
+        # and Ember KOs the 12 HP Bulbasaur
+        enemy, player = clone_pokemon(CHARMANDER), clone_pokemon(BULBASAUR)
+        enemy.hp, enemy.burn = 4, 2
+        player.hp = 12
+        apply_burn(enemy)
+        self.assertEqual((enemy.hp, enemy.burn), (2, 1))
+        self.assertEqual(self.pick(enemy, player), "Ember")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import json
+import os
+import sys
+import tempfile
+import types
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pokemon_battle
+
+
+class FakeWidget:
+    """Just enough of a Tk widget for BattleApp: records options and, for the log, its text."""
+
+    def __init__(self, *args, **kwargs):
+        self.options = dict(kwargs)
+        self.text = ""
+
+    def config(self, **kwargs):
+        self.options.update(kwargs)
+
+    configure = config
+
+    def insert(self, index, text):
+        assert self.options.get("state") != "disabled", "insert into a disabled Text"
+        self.text += text
+
+    def delete(self, start, end):
+        assert self.options.get("state") != "disabled", "delete from a disabled Text"
+        self.text = ""
+
+    def _noop(self, *args, **kwargs):
+        pass
+
+    pack = grid = see = title = resizable = geometry = grab_set = destroy = bind = _noop
+
+
+class FakeVar:
+    def __init__(self, value=""):
+        self.value = value
+
+    def set(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+
+fake_tk = types.SimpleNamespace(
+    Tk=FakeWidget, Label=FakeWidget, Frame=FakeWidget, Text=FakeWidget, Button=FakeWidget, Toplevel=FakeWidget,
+    StringVar=FakeVar, Event=object, NORMAL="normal", DISABLED="disabled", END="end", WORD="word",
+)
+
+
+class HeadlessMatchTest(unittest.TestCase):
+    def test_plays_a_full_match(self):
+        with tempfile.TemporaryDirectory() as tmp, \
+                mock.patch.object(pokemon_battle, "tk", fake_tk), \
+                mock.patch.object(pokemon_battle, "_DATA_DIR", tmp), \
+                mock.patch.object(pokemon_battle, "_RECORD_PATH", os.path.join(tmp, "record.json")), \
+                mock.patch.dict(os.environ, {"BATTLE_SEED": "11"}):
+            app = pokemon_battle.BattleApp(FakeWidget(), headless=True)
+            for _ in range(500):
+                if app.player_wins >= 2 or app.enemy_wins >= 2:
+                    break
+                if app.player.hp <= 0:
+                    # on_switch refuses once the active Pokémon has fainted, so bring in the survivor directly
+                    app.active_idx = next(i for i, p in enumerate(app.party) if p.hp > 0)
+                    app.player = app.party[app.active_idx]
+                app.on_move_click(1)
+
+            self.assertTrue(app.player_wins >= 2 or app.enemy_wins >= 2)
+            self.assertEqual(app.record["wins"] + app.record["losses"], 1)
+            with open(os.path.join(tmp, "record.json"), "rb") as f:
+                self.assertEqual(json.loads(f.read()), app.record)
+            log = app.txt_log.text
+            self.assertTrue(log.startswith("Battle started!"), repr(log[:40]))
+            self.assertEqual(app.txt_log.options["state"], "disabled")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,28 @@
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from pokemon_battle import ROSTER, clone_pokemon, deal_damage_batch
+
+CHARMANDER, SQUIRTLE, BULBASAUR = ROSTER
+
+
+class DealDamageBatchTest(unittest.TestCase):
+    def test_rolls_stay_in_range_and_miss_at_the_move_accuracy(self):
+        # Ember (14 power, 95 accuracy) on Bulbasaur is 2x: 24-32 damage, 36-48 on a crit, 0 on a miss
+        ember = CHARMANDER.moves[1]
+        target = clone_pokemon(BULBASAUR)
+        target.hp = 20
+        n = 20000
+        rolls = deal_damage_batch(target, ember, n, random.Random(7))
+        self.assertEqual(len(rolls), n)
+        self.assertTrue(all(r == 0 or 24 <= r <= 48 for r in rolls))
+        self.assertAlmostEqual(rolls.count(0) / n, 0.05, delta=0.01)
+        self.assertEqual((target.hp, target.burn), (20, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
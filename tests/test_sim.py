@@ -0,0 +1,64 @@
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from pokemon_battle import ROSTER, Move, Pokemon, clone_pokemon, deal_damage_batch
+from sim import (
+    MOVE_SLOTS, BattleArray, RosterArrays, batch_deal, minimax_policy, simulate_match_batch, weighted_policy,
+)
+
+CHARMANDER, SQUIRTLE, BULBASAUR = ROSTER
+
+
+class BatchDealTest(unittest.TestCase):
+    def test_matches_deal_damage_batch(self):
+        # (move, defender): 2x with 95 accuracy, 1x sure hit, 0.5x with 95 accuracy
+        cases = [(CHARMANDER.moves[1], BULBASAUR), (CHARMANDER.moves[0], SQUIRTLE), (SQUIRTLE.moves[1], BULBASAUR)]
+        n = 20000
+        for move, defender in cases:
+            with self.subTest(move=move.name, defender=defender.name):
+                quantized = batch_deal(clone_pokemon(defender), move, n, random.Random(1))
+                exact = deal_damage_batch(clone_pokemon(defender), move, n, random.Random(2))
+                self.assertEqual(set(quantized), set(exact))
+                self.assertAlmostEqual(sum(quantized) / n, sum(exact) / n, delta=0.03 * sum(exact) / n)
+
+    def test_zero_power_never_damages(self):
+        splash = Move("Splash", "Normal", 0)
+        self.assertEqual(batch_deal(clone_pokemon(SQUIRTLE), splash, 50, random.Random(1)), [0] * 50)
+
+
+class SimulatorTest(unittest.TestCase):
+    roster = RosterArrays(ROSTER)
+
+    def test_every_battle_is_counted_once(self):
+        for policy in (minimax_policy, weighted_policy):
+            with self.subTest(policy=policy.__name__):
+                wins, losses, ties = simulate_match_batch(0, 1, policy, n=300, roster=self.roster, rng=random.Random(3))
+                self.assertEqual(wins + losses + ties, 300)
+
+    def test_type_advantage_wins(self):
+        # Squirtle (roster 1) beats Charmander (roster 0), whichever side moves first
+        wins, _, _ = simulate_match_batch(1, 0, n=300, roster=self.roster, rng=random.Random(4))
+        self.assertGreater(wins, 270)
+        _, losses, _ = simulate_match_batch(0, 1, n=300, roster=self.roster, rng=random.Random(5))
+        self.assertGreater(losses, 270)
+
+    def test_unused_move_slots_are_padded_with_zero_power(self):
+        splasher = Pokemon("Magikarp", "Water", 20, 20, (Move("Splash", "Normal", 0),))
+        arrays = RosterArrays([splasher, splasher])
+        self.assertEqual(list(arrays.move_power[:MOVE_SLOTS]), [0] * MOVE_SLOTS)
+        self.assertEqual(list(arrays.move_acc[1:MOVE_SLOTS]), [100] * (MOVE_SLOTS - 1))
+        self.assertEqual(arrays.weighted[0], (0,))
+
+    def test_stalemates_hit_the_turn_cap_as_ties(self):
+        splasher = Pokemon("Magikarp", "Water", 20, 20, (Move("Splash", "Normal", 0),))
+        battle = BattleArray(RosterArrays([splasher, splasher]), [(0, 1)] * 10, rng=random.Random(6))
+        self.assertEqual(battle.run(), (0, 0, 10))
+        self.assertEqual(list(battle.hp[0]), [20] * 10)
+
+
+if __name__ == "__main__":
+    unittest.main()